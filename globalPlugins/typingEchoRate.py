@@ -4,14 +4,18 @@
 
 from __future__ import annotations
 
+import sys
 import unicodedata
 import json
+from collections import deque
 
 import globalPluginHandler
 import gui
 import wx
 import config
 import api
+import controlTypes
+import synthDriverHandler
 
 from gui import guiHelper
 from logHandler import log
@@ -25,6 +29,21 @@ from config.configFlags import TypingEcho
 
 _ADDON_SECTION = "typingEchoRate"
 
+# Interned config keys, so the hot-path conf.get lookups compare by pointer.
+_KEY_TYPING_RATE = sys.intern("typingRate")
+_KEY_ONECORE_BOOST = sys.intern("oneCoreBoost")
+_KEY_SPELLING_RATE = sys.intern("spellingRate")
+_KEY_ONECORE_SPELL_BOOST = sys.intern("oneCoreSpellBoost")
+_KEY_TYPING_RATES_JSON = sys.intern("typingRatesJson")
+_KEY_ONECORE_BOOST_JSON = sys.intern("oneCoreBoostJson")
+_KEY_SPELLING_RATES_JSON = sys.intern("spellingRatesJson")
+_KEY_ONECORE_SPELL_BOOST_JSON = sys.intern("oneCoreSpellBoostJson")
+
+# Bound once at import so the map helpers skip the module attribute lookups.
+_JSON_LOADS = json.loads
+_JSON_DUMPS = json.dumps
+_JSON_SEP = (",", ":")
+
 _originalSpeakTypedCharacters_mod = None  # type: ignore
 _originalSpeakTypedCharacters_pkg = None  # type: ignore
 _isPatched = False
@@ -70,7 +89,8 @@ def _getActiveSynthName() -> str:
     try:
         synth = _speech.getSynth()
         if synth and getattr(synth, "name", None):
-            return str(synth.name)
+            # Interned so the per-synth map lookups compare by pointer after hash.
+            return sys.intern(str(synth.name))
     except Exception:
         pass
     return ""
@@ -84,158 +104,123 @@ def _getMaxRateForSynth(name: str) -> int:
     return 100
 
 
-def _loadBoostMap(conf) -> dict:
-    raw = conf.get("oneCoreBoostJson", "") or ""
-    try:
-        data = json.loads(raw)
-        if isinstance(data, dict):
-            out = {}
-            for k, v in data.items():
-                try:
-                    out[str(k)] = int(v)
-                except Exception:
-                    continue
-            return out
-    except Exception:
-        pass
-    return {}
-
-def _saveBoostMap(conf, m: dict) -> None:
-    try:
-        conf["oneCoreBoostJson"] = json.dumps(m, ensure_ascii=False, separators=(",", ":"))
-    except Exception:
-        conf["oneCoreBoostJson"] = ""
+# Parsed per-synth maps, keyed by config field name. Each entry stores the raw JSON
+# string alongside the parsed dict, so the typing-echo hot path only pays for
+# json.loads when the config string actually changes (i.e. on save), not per keystroke.
+_MAP_CACHE: dict = {}
 
 
-def _loadSpellBoostMap(conf) -> dict:
-    raw = conf.get("oneCoreSpellBoostJson", "") or ""
+def _parseIntMap(raw: str) -> dict:
+    out = {}
     try:
-        data = json.loads(raw)
+        data = _JSON_LOADS(raw)
         if isinstance(data, dict):
-            out = {}
             for k, v in data.items():
                 try:
-                    out[str(k)] = int(v)
+                    out[sys.intern(str(k))] = int(v)
                 except Exception:
                     continue
-            return out
     except Exception:
         pass
-    return {}
+    return out
 
 
-def _saveSpellBoostMap(conf, m: dict) -> None:
-    try:
-        conf["oneCoreSpellBoostJson"] = json.dumps(m, ensure_ascii=False, separators=(",", ":"))
-    except Exception:
-        conf["oneCoreSpellBoostJson"] = ""
-
-def _getBoostForSynth(conf, synthName: str) -> int:
-    m = _loadBoostMap(conf)
-    if synthName and synthName in m:
-        try:
-            return int(m[synthName])
-        except Exception:
-            return 0
-    try:
-        return int(conf.get("oneCoreBoost", 0))
-    except Exception:
-        return 0
+def _loadIntMap(conf, key: str) -> dict:
+    """Load a {synthName: int} map from the JSON config field named by key."""
+    raw = conf.get(key, "") or ""
+    cached = _MAP_CACHE.get(key)
+    if cached is not None and (cached[0] is raw or cached[0] == raw):
+        return cached[1]
+    out = _parseIntMap(raw)
+    _MAP_CACHE[key] = (raw, out)
+    return out
 
 
-def _getSpellBoostForSynth(conf, synthName: str) -> int:
-    m = _loadSpellBoostMap(conf)
-    if synthName and synthName in m:
-        try:
-            return int(m[synthName])
-        except Exception:
-            return 0
+def _saveIntMap(conf, key: str, m: dict) -> None:
+    """Store a {synthName: int} map into the JSON config field named by key."""
     try:
-        return int(conf.get("oneCoreSpellBoost", 0))
+        raw = _JSON_DUMPS(m, ensure_ascii=False, separators=_JSON_SEP)
     except Exception:
-        return 0
+        raw = ""
+    conf[key] = raw
+    _MAP_CACHE[key] = (raw, dict(m))
+    _bumpConfigVersion()
 
-def _loadTypingRatesMap(conf) -> dict:
-    raw = conf.get("typingRatesJson", "") or ""
-    try:
-        data = json.loads(raw)
-        if isinstance(data, dict):
-            out = {}
-            for k, v in data.items():
-                try:
-                    out[str(k)] = int(v)
-                except Exception:
-                    continue
-            return out
-    except Exception:
-        pass
-    return {}
-
-def _saveTypingRatesMap(conf, m: dict) -> None:
-    try:
-        conf["typingRatesJson"] = json.dumps(m, ensure_ascii=False, separators=(",", ":"))
-    except Exception:
-        conf["typingRatesJson"] = ""
+# The per-synth getters run on the hot path; map values are guaranteed ints by
+# _parseIntMap and the fallback keys are declared integer() in the config spec,
+# so no defensive int() conversion or try/except is needed here.
 
-
-def _loadSpellingRatesMap(conf) -> dict:
-    raw = conf.get("spellingRatesJson", "") or ""
-    try:
-        data = json.loads(raw)
-        if isinstance(data, dict):
-            out = {}
-            for k, v in data.items():
-                try:
-                    out[str(k)] = int(v)
-                except Exception:
-                    continue
-            return out
-    except Exception:
-        pass
-    return {}
+def _getBoostForSynth(conf, synthName: str) -> int:
+    m = _loadIntMap(conf, _KEY_ONECORE_BOOST_JSON)
+    return m.get(synthName, conf.get(_KEY_ONECORE_BOOST, 0))
 
 
-def _saveSpellingRatesMap(conf, m: dict) -> None:
-    try:
-        conf["spellingRatesJson"] = json.dumps(m, ensure_ascii=False, separators=(",", ":"))
-    except Exception:
-        conf["spellingRatesJson"] = ""
+def _getSpellBoostForSynth(conf, synthName: str) -> int:
+    m = _loadIntMap(conf, _KEY_ONECORE_SPELL_BOOST_JSON)
+    return m.get(synthName, conf.get(_KEY_ONECORE_SPELL_BOOST, 0))
 
 def _getTypingRateForSynth(conf, synthName: str) -> int:
-    m = _loadTypingRatesMap(conf)
-    if synthName and synthName in m:
-        return int(m[synthName])
-    try:
-        return int(conf.get("typingRate", -1))
-    except Exception:
-        return -1
+    m = _loadIntMap(conf, _KEY_TYPING_RATES_JSON)
+    return m.get(synthName, conf.get(_KEY_TYPING_RATE, -1))
 
 
 def _getSpellingRateForSynth(conf, synthName: str) -> int:
-    m = _loadSpellingRatesMap(conf)
-    if synthName and synthName in m:
-        return int(m[synthName])
-    try:
-        return int(conf.get("spellingRate", -1))
-    except Exception:
-        return -1
+    m = _loadIntMap(conf, _KEY_SPELLING_RATES_JSON)
+    return m.get(synthName, conf.get(_KEY_SPELLING_RATE, -1))
+
+
+# NVDA's default rate for the active synth, cached because RateCommand().defaultValue
+# rounds-trips through the synth driver; cleared together with the offset cache on
+# synth change and config profile switch.
+_cachedDefaultRate = None
 
 
 def _getDefaultSpeechRate() -> int:
     """Return NVDA's current configured speech rate (0..100) for the active synth."""
+    global _cachedDefaultRate
+    rate = _cachedDefaultRate
+    if rate is not None:
+        return rate
+    rate = 50
     try:
-        return int(RateCommand().defaultValue)
+        rate = int(RateCommand().defaultValue)
     except Exception:
         # As a fallback, mirror the common config layout.
         try:
             synth = _speech.getSynth()
             if synth:
-                return int(config.conf["speech"][synth.name]["rate"])
+                rate = int(config.conf["speech"][synth.name]["rate"])
         except Exception:
             pass
-    return 50
+    _cachedDefaultRate = rate
+    return rate
+
 
 
+# Memoized typing/spelling offsets. The computed offset only changes when the add-on
+# config is saved (tracked via _configVersion), the active synth changes, or NVDA's
+# default rate changes (both captured in the cache key), so the per-keystroke cost
+# shrinks to a key compare on the steady-state path.
+_configVersion = 0
+_cachedTypingOffset = 0
+_cachedTypingOffsetKey = None
+_cachedSpellingOffset = 0
+_cachedSpellingOffsetKey = None
+
+
+def _bumpConfigVersion() -> None:
+    global _configVersion
+    _configVersion += 1
+
+
+def _invalidateOffsetCache(*args, **kwargs) -> None:
+    """Drop memoized offsets and the cached default rate; registered for synth change
+    and config profile switch."""
+    global _cachedTypingOffsetKey, _cachedSpellingOffsetKey, _cachedDefaultRate
+    _cachedTypingOffsetKey = None
+    _cachedSpellingOffsetKey = None
+    _cachedDefaultRate = None
+
 
 def _computeTypingRateOffset() -> int:
     """Compute offset for typed echo relative to the active synth default rate.
@@ -243,69 +228,97 @@ def _computeTypingRateOffset() -> int:
     For OneCore, an additional optional boost is added (0..50) to make changes near the top end
     more noticeable, while keeping the main typing rate slider consistent (0..100).
     """
-    conf = _getConf()
-    if not conf.get("enabledSpelling", conf.get("enabled", True)):
-        return 0
+    global _cachedTypingOffset, _cachedTypingOffsetKey
 
     synthName = _getActiveSynthName()
     defaultRate = _getDefaultSpeechRate()
+    key = (synthName, defaultRate, _configVersion)
+    if key == _cachedTypingOffsetKey:
+        return _cachedTypingOffset
 
-    typingRate = _getTypingRateForSynth(conf, synthName)
-    if typingRate < 0:
-        # Follow default speech rate unless a OneCore boost is configured.
-        typingRate = defaultRate
-
-    # Clamp typing rate to 0..100.
-    if typingRate < 0:
-        typingRate = 0
-    elif typingRate > 100:
-        typingRate = 100
+    conf = _getConf()
+    if not conf.get("enabledSpelling", conf.get("enabled", True)):
+        offset = 0
+    else:
+        typingRate = _getTypingRateForSynth(conf, synthName)
+        if typingRate < 0:
+            # Follow default speech rate unless a OneCore boost is configured.
+            typingRate = defaultRate
+
+        # Clamp typing rate to 0..100.
+        if typingRate < 0:
+            typingRate = 0
+        elif typingRate > 100:
+            typingRate = 100
 
-    offset = typingRate - defaultRate
+        offset = typingRate - defaultRate
 
-    # Optional OneCore boost (adds extra offset, not an absolute rate).
-    if _isOneCoreSynthName(synthName):
-        boost = _getBoostForSynth(conf, synthName)
-        if boost < 0:
-            boost = 0
-        elif boost > 100:
-            boost = 100
-        offset += boost
+        # Optional OneCore boost (adds extra offset, not an absolute rate).
+        if _isOneCoreSynthName(synthName):
+            boost = _getBoostForSynth(conf, synthName)
+            if boost < 0:
+                boost = 0
+            elif boost > 100:
+                boost = 100
+            offset += boost
 
+    _cachedTypingOffset = offset
+    _cachedTypingOffsetKey = key
     return offset
 
 
 def _computeSpellingRateOffset() -> int:
     """Compute offset for spelling relative to the active synth default rate."""
-    conf = _getConf()
-    if not conf.get("enabled", True):
-        return 0
+    global _cachedSpellingOffset, _cachedSpellingOffsetKey
 
     synthName = _getActiveSynthName()
     defaultRate = _getDefaultSpeechRate()
+    key = (synthName, defaultRate, _configVersion)
+    if key == _cachedSpellingOffsetKey:
+        return _cachedSpellingOffset
 
-    spellingRate = _getSpellingRateForSynth(conf, synthName)
-    if spellingRate < 0:
-        spellingRate = defaultRate
+    conf = _getConf()
+    if not conf.get("enabled", True):
+        offset = 0
+    else:
+        spellingRate = _getSpellingRateForSynth(conf, synthName)
+        if spellingRate < 0:
+            spellingRate = defaultRate
 
-    if spellingRate < 0:
-        spellingRate = 0
-    elif spellingRate > 100:
-        spellingRate = 100
+        if spellingRate < 0:
+            spellingRate = 0
+        elif spellingRate > 100:
+            spellingRate = 100
 
-    offset = spellingRate - defaultRate
+        offset = spellingRate - defaultRate
 
-    if _isOneCoreSynthName(synthName):
-        boost = _getSpellBoostForSynth(conf, synthName)
-        if boost < 0:
-            boost = 0
-        elif boost > 100:
-            boost = 100
-        offset += boost
+        if _isOneCoreSynthName(synthName):
+            boost = _getSpellBoostForSynth(conf, synthName)
+            if boost < 0:
+                boost = 0
+            elif boost > 100:
+                boost = 100
+            offset += boost
 
+    _cachedSpellingOffset = offset
+    _cachedSpellingOffsetKey = key
     return offset
 
 
+# Reused (lead, trail) RateCommand pairs per offset value. The commands are plain data
+# carriers, so sharing instances across utterances is safe; on steady-state typing the
+# offset is constant and this avoids two allocations per character.
+_RATE_CMD_CACHE: dict = {}
+
+
+def _getRateCmds(offset: int):
+    cmds = _RATE_CMD_CACHE.get(offset)
+    if cmds is None:
+        cmds = (RateCommand(offset=offset), RateCommand())
+        _RATE_CMD_CACHE[offset] = cmds
+    return cmds
+
+
 def _speakWithTypingRate(seq):
     """Speak a prepared speech sequence with optional typing-rate injection."""
     offset = _computeTypingRateOffset()
@@ -313,7 +326,8 @@ def _speakWithTypingRate(seq):
         _speech.speak(seq)
         return
     # Inject rate change, then restore to default.
-    _speech.speak([RateCommand(offset=offset), *seq, RateCommand()])
+    lead, trail = _getRateCmds(offset)
+    _speech.speak([lead, *seq, trail])
 
 
 def _speakSpellingWithTypingRate(text: str) -> None:
@@ -340,7 +354,8 @@ def _speakSpellingWithSpellingRate(text: str, *args, **kwargs) -> None:
     if offset == 0:
         _speech.speak(seq)
         return
-    _speech.speak([RateCommand(offset=offset), *seq, RateCommand()])
+    lead, trail = _getRateCmds(offset)
+    _speech.speak([lead, *seq, trail])
 
 
 # --- Monkey patch NVDA typing echo ---
@@ -350,30 +365,72 @@ _ORIG_speakTypedCharacters_pkg = None
 _ORIG_speakSpelling_mod = None
 _ORIG_speakSpelling_pkg = None
 
-# Buffer used by NVDA to assemble typed words.
-_curWordChars: list[str] = []
+# Buffer used by NVDA to assemble typed words. A deque keeps the backspace path a
+# plain pop() without the slice-object allocation of del lst[-1:].
+_curWordChars: deque = deque()
 
 PROTECTED_CHAR = "*"
 FIRST_NONCONTROL_CHAR = " "
 
+# Precomputed letter/mark/number (word-character) classification for ASCII, so typical
+# typing skips the unicodedata call; non-ASCII still falls back to unicodedata.category.
+_IS_WORD_CHAR_ASCII = bytes(
+    1 if unicodedata.category(chr(i))[0] in ("L", "M", "N") else 0 for i in range(128)
+)
+
 
 def _clearTypedWordBuffer() -> None:
     _curWordChars.clear()
 
 
-def _isFocusEditable() -> bool:
-    """Check if the currently focused object is editable (roughly matching NVDA core)."""
+# Per-keystroke config values, re-read only on profile switch or settings save so the
+# patched function does plain dict reads instead of ConfigObj section traversals.
+_HOT = {
+    "speakTypedWords": 0,
+    "speakTypedCharacters": 0,
+    "applyToWords": False,
+    "enabled": True,
+    "enabledSpelling": True,
+}
+
+
+def _refreshHot(*args, **kwargs) -> None:
+    """Pull the hot-path config values into _HOT (registered for profile switches)."""
+    try:
+        kb = config.conf["keyboard"]
+        _HOT["speakTypedWords"] = kb["speakTypedWords"]
+        _HOT["speakTypedCharacters"] = kb["speakTypedCharacters"]
+    except Exception:
+        pass
+    try:
+        conf = _getConf()
+        _HOT["enabled"] = bool(conf.get("enabled", True))
+        _HOT["enabledSpelling"] = bool(conf.get("enabledSpelling", conf.get("enabled", True)))
+        _HOT["applyToWords"] = bool(conf.get("applyToWords", False))
+    except Exception:
+        pass
+
+
+# Editable-ness of the focused object, updated from focus events (see
+# GlobalPlugin.event_gainFocus) so the EDIT_CONTROLS branch of the keystroke
+# handler reads a plain boolean instead of probing the focus object each time.
+_focusEditableCached = True
+
+try:
+    _EDITABLE_ROLES = frozenset({
+        controlTypes.ROLE_EDITABLETEXT,
+        controlTypes.ROLE_DOCUMENT,
+        controlTypes.ROLE_TERMINAL,
+    })
+except Exception:
+    _EDITABLE_ROLES = frozenset()
+
+
+def _computeFocusEditable(obj) -> bool:
+    """Check if the given object is editable (roughly matching NVDA core)."""
     try:
-        import controlTypes
-
-        obj = api.getFocusObject()
-        controls = {
-            controlTypes.ROLE_EDITABLETEXT,
-            controlTypes.ROLE_DOCUMENT,
-            controlTypes.ROLE_TERMINAL,
-        }
         return (
-            (obj.role in controls or controlTypes.STATE_EDITABLE in obj.states)
+            (obj.role in _EDITABLE_ROLES or controlTypes.STATE_EDITABLE in obj.states)
             and controlTypes.STATE_READONLY not in obj.states
         )
     except Exception:
@@ -381,7 +438,29 @@ def _isFocusEditable() -> bool:
         return True
 
 
-def _patched_speakTypedCharacters(ch: str):
+def _updateFocusEditable(obj) -> None:
+    global _focusEditableCached
+    _focusEditableCached = _computeFocusEditable(obj)
+
+
+def _isFocusEditable() -> bool:
+    return _focusEditableCached
+
+
+def _patched_speakTypedCharacters(
+    ch: str,
+    # Hot names bound once as defaults so the per-character body uses LOAD_FAST
+    # instead of repeated LOAD_GLOBAL / attribute lookups.
+    _PROT=PROTECTED_CHAR,
+    _FNC=FIRST_NONCONTROL_CHAR,
+    _ASCII_WORD=_IS_WORD_CHAR_ASCII,
+    _cat=unicodedata.category,
+    _hot=_HOT,
+    _log=log,
+    _ECHO_OFF=TypingEcho.OFF.value,
+    _ECHO_ALWAYS=TypingEcho.ALWAYS.value,
+    _ECHO_EDIT=TypingEcho.EDIT_CONTROLS.value,
+):
     """
     Wrap NVDA typing echo and inject an optional typing rate only for typed chars / words.
 
@@ -390,43 +469,48 @@ def _patched_speakTypedCharacters(ch: str):
     """
     try:
         typingIsProtected = api.isTypingProtected()
-        realChar = PROTECTED_CHAR if typingIsProtected else ch
+        realChar = _PROT if typingIsProtected else ch
 
         # Keep a buffer for typed words.
-        if unicodedata.category(ch)[0] in "LMN":
+        o = ord(ch)
+        isWordChar = (
+            _ASCII_WORD[o] if o < 128 else _cat(ch)[0] in ("L", "M", "N")
+        )
+        if isWordChar:
             _curWordChars.append(realChar)
         elif ch == "\b":
             # Backspace.
-            del _curWordChars[-1:]
+            if _curWordChars:
+                _curWordChars.pop()
         elif ch == "\u007f":
             # Delete generated in some apps with control+backspace.
             return
         elif len(_curWordChars) > 0:
             typedWord = "".join(_curWordChars)
             _clearTypedWordBuffer()
-            if log.isEnabledFor(log.IO):
-                log.io("typed word: %s" % typedWord)
-
-            if (not typingIsProtected) and _getConf().get("applyToWords", False):
-                typingEchoMode = config.conf["keyboard"]["speakTypedWords"]
-                if typingEchoMode != TypingEcho.OFF.value:
-                    if typingEchoMode == TypingEcho.ALWAYS.value or (
-                        typingEchoMode == TypingEcho.EDIT_CONTROLS.value and _isFocusEditable()
+            if _log.isEnabledFor(_log.IO):
+                _log.io("typed word: %s" % typedWord)
+
+            if (not typingIsProtected) and _hot["applyToWords"]:
+                typingEchoMode = _hot["speakTypedWords"]
+                if typingEchoMode != _ECHO_OFF:
+                    if typingEchoMode == _ECHO_ALWAYS or (
+                        typingEchoMode == _ECHO_EDIT and _isFocusEditable()
                     ):
                         _speakTextWithTypingRate(typedWord)
             else:
                 # fall back to NVDA core for typed words if we are not applying our typing rate
-                typingEchoMode = config.conf["keyboard"]["speakTypedWords"]
-                if typingEchoMode != TypingEcho.OFF.value and not typingIsProtected:
-                    if typingEchoMode == TypingEcho.ALWAYS.value or (
-                        typingEchoMode == TypingEcho.EDIT_CONTROLS.value and _isFocusEditable()
+                typingEchoMode = _hot["speakTypedWords"]
+                if typingEchoMode != _ECHO_OFF and not typingIsProtected:
+                    if typingEchoMode == _ECHO_ALWAYS or (
+                        typingEchoMode == _ECHO_EDIT and _isFocusEditable()
                     ):
                         _speech.speakText(typedWord)
 
-        typingEchoMode = config.conf["keyboard"]["speakTypedCharacters"]
-        if typingEchoMode != TypingEcho.OFF.value and ch >= FIRST_NONCONTROL_CHAR:
-            if typingEchoMode == TypingEcho.ALWAYS.value or (
-                typingEchoMode == TypingEcho.EDIT_CONTROLS.value and _isFocusEditable()
+        typingEchoMode = _hot["speakTypedCharacters"]
+        if typingEchoMode != _ECHO_OFF and ch >= _FNC:
+            if typingEchoMode == _ECHO_ALWAYS or (
+                typingEchoMode == _ECHO_EDIT and _isFocusEditable()
             ):
                 _speakSpellingWithTypingRate(realChar)
     except Exception:
@@ -682,10 +766,10 @@ class TypingEchoRateSettingsPanel(gui.SettingsPanel):
         elif val > 100:
             val = 100
 
-        m = _loadTypingRatesMap(conf)
+        m = _loadIntMap(conf, _KEY_TYPING_RATES_JSON)
         if synthName:
             m[synthName] = val
-            _saveTypingRatesMap(conf, m)
+            _saveIntMap(conf, _KEY_TYPING_RATES_JSON, m)
         else:
             conf["typingRate"] = val
 
@@ -700,10 +784,10 @@ class TypingEchoRateSettingsPanel(gui.SettingsPanel):
             elif b > 100:
                 b = 100
 
-            bm = _loadBoostMap(conf)
+            bm = _loadIntMap(conf, _KEY_ONECORE_BOOST_JSON)
             if synthName:
                 bm[synthName] = b
-                _saveBoostMap(conf, bm)
+                _saveIntMap(conf, _KEY_ONECORE_BOOST_JSON, bm)
             else:
                 conf["oneCoreBoost"] = b
 
@@ -718,10 +802,10 @@ class TypingEchoRateSettingsPanel(gui.SettingsPanel):
         elif sval > 100:
             sval = 100
 
-        sm = _loadSpellingRatesMap(conf)
+        sm = _loadIntMap(conf, _KEY_SPELLING_RATES_JSON)
         if synthName:
             sm[synthName] = sval
-            _saveSpellingRatesMap(conf, sm)
+            _saveIntMap(conf, _KEY_SPELLING_RATES_JSON, sm)
         else:
             conf["spellingRate"] = sval
 
@@ -736,13 +820,18 @@ class TypingEchoRateSettingsPanel(gui.SettingsPanel):
             elif sb > 100:
                 sb = 100
 
-            sbm = _loadSpellBoostMap(conf)
+            sbm = _loadIntMap(conf, _KEY_ONECORE_SPELL_BOOST_JSON)
             if synthName:
                 sbm[synthName] = sb
-                _saveSpellBoostMap(conf, sbm)
+                _saveIntMap(conf, _KEY_ONECORE_SPELL_BOOST_JSON, sbm)
             else:
                 conf["oneCoreSpellBoost"] = sb
 
+        # The enable flags and fallback keys above are written directly, so make sure
+        # the memoized offsets are recomputed on the next keystroke.
+        _bumpConfigVersion()
+        _refreshHot()
+
 
 
 # --- Global plugin ---
@@ -754,10 +843,29 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         _initConfigSpec()
         self._migrateOldConfigIfNeeded()
         self._patchSpeech()
+        try:
+            config.post_configProfileSwitch.register(_invalidateOffsetCache)
+            config.post_configProfileSwitch.register(_refreshHot)
+        except Exception:
+            pass
+        try:
+            synthDriverHandler.synthChanged.register(_invalidateOffsetCache)
+        except Exception:
+            pass
+        _refreshHot()
+        # Seed the focus cache; afterwards event_gainFocus keeps it current.
+        try:
+            _updateFocusEditable(api.getFocusObject())
+        except Exception:
+            pass
         gui.settingsDialogs.NVDASettingsDialog.categoryClasses.append(
             TypingEchoRateSettingsPanel
         )
 
+    def event_gainFocus(self, obj, nextHandler):
+        _updateFocusEditable(obj)
+        nextHandler()
+
     def terminate(self):
         try:
             gui.settingsDialogs.NVDASettingsDialog.categoryClasses.remove(
@@ -765,6 +873,15 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             )
         except Exception:
             pass
+        try:
+            config.post_configProfileSwitch.unregister(_invalidateOffsetCache)
+            config.post_configProfileSwitch.unregister(_refreshHot)
+        except Exception:
+            pass
+        try:
+            synthDriverHandler.synthChanged.unregister(_invalidateOffsetCache)
+        except Exception:
+            pass
         self._unpatchSpeech()
         super().terminate()
 
@@ -773,7 +890,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         conf = _getConf()
 
         synthName = _getActiveSynthName()
-        m = _loadTypingRatesMap(conf)
+        m = _loadIntMap(conf, _KEY_TYPING_RATES_JSON)
 
         # v0.1.0 used rateOffset; convert to absolute based on current default rate.
         if "rateOffset" in conf and synthName and synthName not in m:
@@ -789,7 +906,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             elif absRate > maxRate:
                 absRate = maxRate
             m[synthName] = absRate
-            _saveTypingRatesMap(conf, m)
+            _saveIntMap(conf, _KEY_TYPING_RATES_JSON, m)
             try:
                 del conf["rateOffset"]
             except Exception:
@@ -805,7 +922,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             if legacyAbs > maxRate:
                 legacyAbs = maxRate
             m[synthName] = legacyAbs
-            _saveTypingRatesMap(conf, m)
+            _saveIntMap(conf, _KEY_TYPING_RATES_JSON, m)
 
     def _patchSpeech(self):
         global _ORIG_speakTypedCharacters_mod, _ORIG_speakTypedCharacters_pkg